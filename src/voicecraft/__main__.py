@@ -1,13 +1,16 @@
+import asyncio
 import os
+import re
 import sys
 from pathlib import Path
 import wave
 import click
 import yaml
 from voicecraft.filename_generator import FilenameGenerator
-from voicecraft.speech_synthesizer import synthesizer_factory
 from voicecraft.config_generator import ConfigGenerator
 
+# libyaml が使える環境では C 実装のローダーを使う
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 
@@ -19,7 +22,7 @@ def read_config_file(config_path: str) -> dict:
     
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=Loader)
         return config
     except yaml.YAMLError as e:
         click.echo(f"Error parsing YAML config file: {e}", err=True)
@@ -29,25 +32,153 @@ def read_config_file(config_path: str) -> dict:
         sys.exit(1)
 
 
+WAV_WRITE_BUFFER_SIZE = 1 << 20
+WAV_WRITE_CHUNK_SIZE = 256 * 1024
+
+
+def _load_mapping(text: str, path: Path) -> dict:
+    """YAML を解析し、トップレベルがマッピングであることを確認する"""
+    data = yaml.load(text, Loader=Loader)
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Config file '{path}' must contain a mapping at the top level.")
+    return data
+
+
+# ブロック形式のトップレベルのキー行 (例: "model_config:")
+_TOP_LEVEL_KEY = re.compile(r"([A-Za-z_][\w-]*)[ \t]*:(?:\s|$)")
+
+
+def quick_parse_header(path: Path, keys=("model_config",)) -> dict:
+    """設定ファイルから指定したトップレベルのキーだけを取り出す
+
+    設定ディレクトリを走査して model_config.name などで候補を絞り込む用途向け。
+    行単位でトップレベルのキーを探し、該当するブロックだけを YAML として解析する。
+    ブロック形式のマッピングとして読めない場合はファイル全体を解析する。
+    トップレベルがマッピングでない場合は ValueError を送出する。
+    """
+    wanted = set(keys)
+    found = set()
+    selected = []
+    in_wanted = False
+    with path.open('r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line[0] in ' \t#':
+                # インデントされた行・空行・コメントは直前のキーのブロックに属する
+                if in_wanted:
+                    selected.append(line)
+                continue
+            match = _TOP_LEVEL_KEY.match(line)
+            if match is None:
+                # フロー形式や複数ドキュメントなど、行単位では判断できない
+                found = None
+                break
+            if found == wanted:
+                break
+            in_wanted = match.group(1) in wanted
+            if in_wanted:
+                found.add(match.group(1))
+                selected.append(line)
+
+    if found is not None:
+        if not found:
+            return {}
+        try:
+            header = yaml.load("".join(selected), Loader=Loader)
+        except yaml.YAMLError:
+            header = None
+        if isinstance(header, dict) and set(header) == found:
+            return header
+
+    # アンカー参照などでブロック単体では解析できない場合も含め、全体を読み直す
+    config = _load_mapping(path.read_text(encoding='utf-8'), path)
+    return {key: config[key] for key in keys if key in config}
+
+
 def wave_file(filename, pcm, channels=1, rate=24000, sample_width=2):
-    """WAVファイルを保存する"""
-    with wave.open(filename, "wb") as wf:
-        wf.setnchannels(channels)
-        wf.setsampwidth(sample_width)
-        wf.setframerate(rate)
-        wf.writeframes(pcm)
+    """WAVファイルを保存する
+
+    大きなPCMデータでもメモリ使用量がチャンクサイズに収まるよう、
+    バッファ付きストリームへ memoryview のスライスを順に書き込む。
+    """
+    view = memoryview(pcm)
+    with open(filename, "wb", buffering=WAV_WRITE_BUFFER_SIZE) as f:
+        with wave.open(f, "wb") as wf:
+            wf.setnchannels(channels)
+            wf.setsampwidth(sample_width)
+            wf.setframerate(rate)
+            for start in range(0, len(view), WAV_WRITE_CHUNK_SIZE):
+                wf.writeframesraw(view[start:start + WAV_WRITE_CHUNK_SIZE])
+            # ヘッダーの長さは close() 時にまとめて書き戻される
+
+
+def _write_wav_fixed(path: str, pcm: bytes, rate: int = 24000):
+    """16bit モノラルPCMを固定の44バイトヘッダー付きで直接書き込む
+
+    wave モジュールのフレーム管理を経由しない既定フォーマット用の高速パス。
+    それ以外のフォーマットは wave_file を使う。
+    """
+    # 合成パッケージは重いので、実際に書き込むときに読み込む
+    from voicecraft.speech_synthesizer.wav import build_wav_header
+
+    with open(path, "wb") as f:
+        f.write(build_wav_header(len(pcm), rate))
+        f.write(pcm)
 
 
-def save_audio(audio_data: bytes, output_path: str):
+def write_wav(path: str, pcm: bytes, channels: int = 1, rate: int = 24000, sample_width: int = 2):
+    """PCMデータをWAVファイルに書き込む
+
+    16bit モノラルなら固定ヘッダーの高速パス、それ以外は wave_file を使う。
+    """
+    if channels == 1 and sample_width == 2:
+        _write_wav_fixed(path, pcm, rate)
+    else:
+        wave_file(path, pcm, channels=channels, rate=rate, sample_width=sample_width)
+
+
+def load_text_content(text_content: str) -> str:
+    """テキストがファイルパスであればその内容を、そうでなければテキスト自体を返す
+
+    どちらの場合も前後の空白を一度だけ取り除き、以降の処理ではそのまま使う。
+    """
+    # 複数行の文章や長すぎる文字列はファイルパスではないので stat を省略する
+    if len(text_content) <= 4096 and "\n" not in text_content and os.path.exists(text_content):
+        with open(text_content, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    return text_content.strip()
+
+
+def save_audio(audio_data: bytes, output_path: str, channels: int = 1, rate: int = 24000, sample_width: int = 2):
     """音声データをWAVファイルに保存する"""
     try:
-        wave_file(output_path, audio_data)
+        write_wav(output_path, audio_data, channels, rate, sample_width)
         print(f"Audio saved to: {output_path}")
     except Exception as e:
         print(f"Error saving audio: {e}")
         sys.exit(1)
 
 
+async def _save_audio_async(audio_data: bytes, output_path: str, channels: int = 1, rate: int = 24000, sample_width: int = 2) -> bool:
+    """音声データをワーカースレッドでWAVファイルに保存する"""
+    try:
+        await asyncio.to_thread(write_wav, output_path, audio_data, channels, rate, sample_width)
+        print(f"Audio saved to: {output_path}")
+        return True
+    except Exception as e:
+        print(f"Error saving audio to {output_path}: {e}")
+        return False
+
+
+async def _save_audios_async(audios, output_paths) -> bool:
+    """複数の音声ファイルを並行して保存し、すべて成功したかを返す"""
+    results = await asyncio.gather(
+        *(_save_audio_async(audio_data, output_path) for audio_data, output_path in zip(audios, output_paths))
+    )
+    return all(results)
+
+
 @click.group()
 def cli():
     """VoiceCraft CLI with subcommands."""
@@ -81,11 +212,7 @@ def craft(config, override_text, override_output):
         click.echo("Error: No text content specified in config file or via --override-text.", err=True)
         sys.exit(1)
 
-    if os.path.exists(text_content):
-        with open(text_content, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-    else:
-        content = text_content
+    content = load_text_content(text_content)
 
     if not content:
         click.echo("Error: No text content found.", err=True)
@@ -96,12 +223,19 @@ def craft(config, override_text, override_output):
         base_filename = generator.generate_filename(content, extension="wav")
         output_path = f"outputs/{base_filename}"
 
-    click.echo(f"Output path: {output_path}")
-    click.echo(f"Generating speech for text: {content[:100]}{'...' if len(content) > 100 else ''}")
-    click.echo(f"Model: {model}")
-    click.echo(f"Config: {model_settings}")
+    # ステータス行はまとめて1回で出力する
+    status_lines = [
+        f"Output path: {output_path}",
+        f"Generating speech for text: {content[:100]}{'...' if len(content) > 100 else ''}",
+        f"Model: {model}",
+        f"Config: {model_settings}",
+    ]
     if instructions_content:
-        click.echo(f"Instruction: {instructions_content[:100]}{'...' if len(instructions_content) > 100 else ''}")
+        status_lines.append(f"Instruction: {instructions_content[:100]}{'...' if len(instructions_content) > 100 else ''}")
+    click.echo("\n".join(status_lines))
+
+    # 合成器はプロバイダーSDKを読み込むため、必要になった時点でインポートする
+    from voicecraft.speech_synthesizer import synthesizer_factory
 
     try:
         synthesizer = synthesizer_factory(model, model_settings)
@@ -113,6 +247,114 @@ def craft(config, override_text, override_output):
     save_audio(audio_data, output_path)
 
 
+def _dedupe_output_path(path: str, taken: set) -> str:
+    """taken と重ならないよう必要なら連番を付けたパスを返し、taken に登録する"""
+    stem, ext = os.path.splitext(path)
+    candidate = path
+    n = 2
+    while os.path.abspath(candidate) in taken:
+        candidate = f"{stem}_{n}{ext}"
+        n += 1
+    taken.add(os.path.abspath(candidate))
+    return candidate
+
+
+@cli.command("craft-batch")
+@click.option('-c', '--config', required=True,
+              help='Path to YAML batch configuration file')
+@click.option('--max-concurrency', type=click.IntRange(min=1), default=8, show_default=True,
+              help='Maximum number of concurrent synthesis requests')
+def craft_batch(config, max_concurrency):
+    """
+    Generate speech for a list of texts in one run.
+    
+    The YAML file has the same `instructions` and `model_config` as `craft`,
+    plus an `items` list whose entries each have a `text` and an optional
+    `output` (a plain string item is treated as its `text`). Outputs must be
+    unique; generated names get a numeric suffix when they collide. Requests
+    are issued concurrently where the provider supports it.
+    """
+    cfg = read_config_file(config)
+
+    items = cfg.get('items') or []
+    instructions_content = cfg.get('instructions', '')
+
+    model_config = cfg.get('model_config', {})
+    model = model_config.get('name', 'openai/gpt-4o-audio-preview')
+    model_settings = model_config.get('config', {})
+
+    if not items:
+        click.echo("Error: No items specified in batch config file.", err=True)
+        sys.exit(1)
+
+    if not isinstance(items, list):
+        click.echo("Error: 'items' in batch config file must be a list.", err=True)
+        sys.exit(1)
+
+    # 文字列だけの項目は text として扱い、それ以外の形は処理を始める前に弾く
+    taken_outputs = set()
+    for i, item in enumerate(items):
+        if isinstance(item, str):
+            item = items[i] = {'text': item}
+        elif not isinstance(item, dict):
+            click.echo(f"Error: Item {i} must be a string or a mapping with 'text' and optional 'output'.", err=True)
+            sys.exit(1)
+
+        for field in ('text', 'output'):
+            value = item.get(field)
+            if value is not None and not isinstance(value, str):
+                click.echo(f"Error: '{field}' of item {i} must be a string.", err=True)
+                sys.exit(1)
+
+        # 同じファイルへ並行に書き込まないよう、出力先の重複を弾く
+        output_path = item.get('output')
+        if output_path:
+            key = os.path.abspath(output_path)
+            if key in taken_outputs:
+                click.echo(f"Error: Output '{output_path}' of item {i} is used by another item.", err=True)
+                sys.exit(1)
+            taken_outputs.add(key)
+
+    contents = []
+    output_paths = []
+    generator = None
+    for i, item in enumerate(items):
+        content = load_text_content(item.get('text') or '')
+        if not content:
+            click.echo(f"Error: No text content found for item {i}.", err=True)
+            sys.exit(1)
+
+        output_path = item.get('output', '')
+        if not output_path:
+            if generator is None:
+                generator = FilenameGenerator(provider="openai")
+            base_filename = generator.generate_filename(content, extension="wav")
+            # 生成名は秒単位のタイムスタンプなので、同じ名前になれば連番を付ける
+            output_path = _dedupe_output_path(f"outputs/{base_filename}", taken_outputs)
+
+        contents.append(content)
+        output_paths.append(output_path)
+
+    click.echo("\n".join([
+        f"Generating speech for {len(contents)} items",
+        f"Model: {model}",
+        f"Config: {model_settings}",
+    ]))
+
+    from voicecraft.speech_synthesizer import synthesizer_factory
+
+    try:
+        synthesizer = synthesizer_factory(model, model_settings)
+        audios = synthesizer.synthesize_many(contents, instructions_content, max_concurrency=max_concurrency)
+    except Exception as e:
+        click.echo(f"Error creating synthesizer or generating speech: {e}", err=True)
+        sys.exit(1)
+
+    # 書き込みは別スレッドで並行に行い、ファイルごとのI/O待ちを重ねる
+    if not asyncio.run(_save_audios_async(audios, output_paths)):
+        sys.exit(1)
+
+
 @cli.command("gen")
 @click.option('--instructions', '-i', required=True, help='Instructions to guide YAML config generation')
 @click.option('--output', '-o', type=click.Path(dir_okay=False, writable=True, path_type=str),
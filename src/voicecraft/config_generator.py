@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import functools
+import logging
 from pathlib import Path
 from typing import Optional
 
-from litellm import completion
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_few_shot(path_str: str, mtime_ns: int) -> str:
+    """Read a few-shot example once per (path, mtime) pair.
+
+    `mtime_ns` is part of the cache key so an edited example is re-read.
+    """
+    return Path(path_str).read_text(encoding="utf-8")
 
 
 class ConfigGenerator:
@@ -31,7 +43,8 @@ class ConfigGenerator:
         if not self.few_shot_path.exists():
             raise FileNotFoundError(f"Few-shot example not found: {self.few_shot_path}")
 
-        self._few_shot_yaml = self.few_shot_path.read_text(encoding="utf-8")
+        st = self.few_shot_path.stat()
+        self._few_shot_yaml = _load_few_shot(str(self.few_shot_path), st.st_mtime_ns)
 
     def _default_few_shot_path(self) -> Path:
         # Project root is two parents up from this file: src/voicecraft/.. -> src -> project root
@@ -43,6 +56,9 @@ class ConfigGenerator:
 
         Returns a YAML string. The model is prompted to return ONLY YAML.
         """
+        # Imported lazily: litellm adds noticeable startup time to every CLI call
+        from litellm import completion
+
         system_prompt = (
             "You are a helpful assistant that generates YAML configuration files for "
             "a speech synthesis tool. Output must be valid YAML only with no prose."
@@ -77,7 +93,7 @@ class ConfigGenerator:
         )
 
         # LiteLLM returns a dict similar to OpenAI
-        print(response)
+        logger.debug("litellm response: %r", response)
         content = response["choices"][0]["message"]["content"]
         return content.strip()
 
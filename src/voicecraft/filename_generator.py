@@ -11,9 +11,14 @@ import os
 import sys
 import hashlib
 import datetime
-import re
+import logging
 from typing import Optional, Union
-import litellm
+
+
+logger = logging.getLogger(__name__)
+
+# ファイル名として使用できない文字を除去し、空白をアンダースコアに置換する変換表
+_FILENAME_TRANSLATION = str.maketrans({' ': '_', **{c: None for c in '<>:"/\\|?*'}})
 
 
 class FilenameGenerator:
@@ -76,6 +81,9 @@ class FilenameGenerator:
     
     def _generate_with_litellm(self, content: str) -> str:
         """LiteLLMを使用してファイル名を生成"""
+        # litellm はインポートが重いため、実際に使うときに読み込む
+        import litellm
+
         system_instruction = """テキストファイルのファイル名を作成してください。指示の中で、テキストファイルに含まれる文の内容を渡すので、それを元にファイル名を考えてください。ファイル名は英語で、短く、内容を表すものにしてください。拡張子は含めないでください。出力はファイル名を１つだけ返すようにしてください。"""
         
         response = litellm.completion(
@@ -87,19 +95,14 @@ class FilenameGenerator:
             reasoning_effort="low",
             max_tokens=1000
         )
-        print(response)
+        logger.debug("litellm response: %r", response)
         
         return response.choices[0].message.content.strip()
     
     def _clean_filename(self, filename: str, max_length: int) -> str:
         """ファイル名をクリーンアップ"""
-        # ファイル名として使用できない文字を除去
-        safe_name = re.sub(r'[<>:"/\\|?*]', '', filename)
-        safe_name = safe_name.replace(' ', '_')
-        
-        # 長さを制限
-        if len(safe_name) > max_length:
-            safe_name = safe_name[:max_length]
+        # 不正な文字の除去と空白の置換を1パスで行い、長さを制限
+        safe_name = filename.translate(_FILENAME_TRANSLATION)[:max_length]
         
         # 空の場合はデフォルト名を使用
         if not safe_name:
@@ -109,7 +112,8 @@ class FilenameGenerator:
     
     def _generate_fallback_filename(self, content: str, extension: str, include_timestamp: bool) -> str:
         """フォールバック: ハッシュベースのファイル名生成"""
-        content_hash = hashlib.md5(content.encode()).hexdigest()[:8]
+        # digest_size=4 で従来と同じ8文字の16進数になる
+        content_hash = hashlib.blake2b(content.encode("utf-8"), digest_size=4).hexdigest()
         
         if include_timestamp:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -10,6 +10,7 @@ from .openai_synthesizer import OpenAISpeechSynthesizer
 from .gemini_synthesizer import GeminiSpeechSynthesizer
 from .factory import synthesizer_factory
 from .gemini_voices import GEMINI_VOICES, validate_voice, get_voice_info, list_all_voices
+from .wav import build_wav_header
 
 __all__ = [
     'SpeechSynthesizer',
@@ -19,5 +20,6 @@ __all__ = [
     'GEMINI_VOICES',
     'validate_voice',
     'get_voice_info',
-    'list_all_voices'
+    'list_all_voices',
+    'build_wav_header'
 ]
@@ -5,12 +5,15 @@ This module provides the abstract base class for speech synthesis.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class SpeechSynthesizer(ABC):
     """Abstract base class for speech synthesis"""
     
+    # Subclasses may declare their own __slots__; those without keep a __dict__
+    __slots__ = ('config',)
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the speech synthesizer
@@ -33,3 +36,22 @@ class SpeechSynthesizer(ABC):
             Audio data as bytes
         """
         pass
+    
+    def synthesize_many(self, texts: List[str], instructions: str = "",
+                        max_concurrency: int = 8) -> List[bytes]:
+        """
+        Synthesize speech for several texts sharing the same instructions
+        
+        The default implementation synthesizes the texts one by one. Subclasses
+        backed by an async API override this to issue up to `max_concurrency`
+        requests at once.
+        
+        Args:
+            texts: Texts to convert to speech
+            instructions: Additional instructions applied to every text
+            max_concurrency: Maximum number of in-flight requests
+            
+        Returns:
+            Audio data for each text, in the same order as `texts`
+        """
+        return [self.synthesize(text, instructions) for text in texts]
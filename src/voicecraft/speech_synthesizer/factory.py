@@ -5,12 +5,20 @@ This module provides the factory function to create appropriate speech synthesiz
 instances based on model names.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Type
 from .base import SpeechSynthesizer
 from .openai_synthesizer import OpenAISpeechSynthesizer
 from .gemini_synthesizer import GeminiSpeechSynthesizer
 
 
+# プロバイダー接頭辞（またはモデル名の先頭）から合成器クラスへの対応表
+_PROVIDERS: Dict[str, Type[SpeechSynthesizer]] = {
+    'openai': OpenAISpeechSynthesizer,
+    'gpt': OpenAISpeechSynthesizer,
+    'gemini': GeminiSpeechSynthesizer,
+}
+
+
 def synthesizer_factory(model_name: str, config: Dict[str, Any]) -> SpeechSynthesizer:
     """
     Factory function to create appropriate speech synthesizer based on model name
@@ -26,9 +34,12 @@ def synthesizer_factory(model_name: str, config: Dict[str, Any]) -> SpeechSynthe
         ValueError: If model_name is not supported
     """
     # モデル名に基づいて適切なクラスを選択
-    if 'openai' in model_name.lower() or 'gpt' in model_name.lower():
-        return OpenAISpeechSynthesizer(config)
-    elif 'gemini' in model_name.lower():
-        return GeminiSpeechSynthesizer(config)
-    else:
+    # 'openai/gpt-4o-audio-preview' のような接頭辞付きの名前は '/' の前で、
+    # 'gemini-2.5-flash-preview-tts' のような素のモデル名は '-' の前で判定する
+    name = model_name.lower()
+    provider = name.split('/', 1)[0]
+    family = name.rsplit('/', 1)[-1].split('-', 1)[0]
+    cls = _PROVIDERS.get(provider) or _PROVIDERS.get(family)
+    if cls is None:
         raise ValueError(f"Unsupported model: {model_name}. Supported models: OpenAI (gpt-*) and Gemini (gemini-*)")
+    return cls(config)
@@ -5,52 +5,278 @@ This module provides the Gemini-based speech synthesizer implementation using
 the official Google GenAI SDK with support for multi-speaker functionality.
 """
 
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, AsyncIterator, IO, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import io
 import os
+import random
+import threading
+import time
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from .base import SpeechSynthesizer
-from .gemini_voices import GEMINI_VOICES, validate_voice, get_voice_info
+from .gemini_voices import GEMINI_VOICES, get_voice_info
+from .wav import WAV_STREAM_LENGTH, build_wav_header
+
+
+# Voice names precomputed once for validation and error messages
+_VOICE_SET = frozenset(GEMINI_VOICES)
+_VOICE_NAMES_STR = ", ".join(sorted(GEMINI_VOICES))
+
+# Gemini TTS returns raw 16-bit mono PCM (L16) at 24 kHz
+GEMINI_SAMPLE_RATE = 24000
+
+
+# HTTP status codes worth retrying: 429 ResourceExhausted, 503 ServiceUnavailable,
+# 504 DeadlineExceeded
+_RETRYABLE_STATUS_CODES = frozenset({429, 503, 504})
+
+
+# Client-side timeouts and dropped connections surface from the SDK as httpx
+# transport errors (or the builtin ones from aiohttp) and are transient too
+_RETRYABLE_TRANSPORT_ERRORS = (httpx.TransportError, ConnectionError, TimeoutError)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Return True for transient API and network errors that should be retried"""
+    if isinstance(error, errors.APIError):
+        return error.code in _RETRYABLE_STATUS_CODES
+    return isinstance(error, _RETRYABLE_TRANSPORT_ERRORS)
+
+
+def _no_audio_error(response) -> RuntimeError:
+    """Build the error for a request that finished without any audio"""
+    # Blocked prompts come back as a candidate with a finish reason but no parts
+    reason = None
+    if response is not None and response.candidates:
+        reason = response.candidates[0].finish_reason
+    return RuntimeError(
+        f"Error generating speech with Gemini: no audio in response "
+        f"(finish reason: {getattr(reason, 'name', reason)})"
+    )
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with a little jitter"""
+    return 0.25 * 2 ** attempt + random.random() * 0.1
+
+
+# GOOGLE_API_KEY, remembered after the first successful lookup
+_API_KEY: Optional[str] = None
+
+
+def _api_key() -> Optional[str]:
+    """Resolve GOOGLE_API_KEY, reading the environment until a key is found"""
+    global _API_KEY
+    if _API_KEY is None:
+        _API_KEY = os.getenv('GOOGLE_API_KEY') or None
+    return _API_KEY
+
+
+# One client per API key for the lifetime of the process, so every synthesizer
+# instance shares the same HTTP connection pool
+_CLIENT_CACHE: Dict[str, genai.Client] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client(api_key: str) -> genai.Client:
+    """Return the shared Gemini client for an API key, creating it on first use"""
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = genai.Client(api_key=api_key)
+            _CLIENT_CACHE[api_key] = client
+        return client
+
+
+# The SDK's async HTTP client is bound to the event loop it first ran on, so
+# all async calls run on one long-lived loop in a daemon thread and callers on
+# any loop (e.g. successive asyncio.run calls) await them from there
+_ASYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop for SDK async calls, starting it on first use"""
+    global _ASYNC_LOOP
+    with _CLIENT_LOCK:
+        if _ASYNC_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='gemini-async', daemon=True).start()
+            _ASYNC_LOOP = loop
+        return _ASYNC_LOOP
+
+
+async def _run_on_async_loop(coro):
+    """Await a coroutine on the background loop from the caller's event loop"""
+    # 呼び出し側でキャンセルされると、バックグラウンド側のタスクもキャンセルされる
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _get_async_loop()))
+
+
+async def _anext_or_none(iterator: AsyncIterator[bytes]) -> Optional[bytes]:
+    """Return the next chunk of an async iterator, or None once it is exhausted"""
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+def close_clients():
+    """Close and forget all shared Gemini clients (mainly for tests)"""
+    with _CLIENT_LOCK:
+        clients = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+    for client in clients:
+        # Client.close() only exists in newer google-genai releases
+        close = getattr(client, 'close', None)
+        if close is not None:
+            close()
+
+
+@dataclass(slots=True)
+class _NormSpeaker:
+    """Speaker settings normalized once at ingestion time"""
+    name: str
+    voice_name: str
+    description: str
+    voice_characteristic: str
+    # Built once here so the speech config can reuse it on every request
+    voice_config: types.SpeakerVoiceConfig
+
+
+def _normalize_speaker(speaker: Any) -> _NormSpeaker:
+    """Convert a speaker given as a dict or an attribute object to a _NormSpeaker"""
+    if isinstance(speaker, _NormSpeaker):
+        return speaker
+    if isinstance(speaker, dict):
+        name = speaker.get('name', '')
+        voice_name = speaker.get('voice_name', '')
+        description = speaker.get('description', '')
+    else:
+        name = getattr(speaker, 'name', '')
+        voice_name = getattr(speaker, 'voice_name', '')
+        description = getattr(speaker, 'description', '')
+    
+    # 音声の特徴情報もここで一度だけ解決しておく
+    voice_info = get_voice_info(voice_name)
+    voice_characteristic = voice_info.characteristic if voice_info else ""
+    voice_config = types.SpeakerVoiceConfig(
+        speaker=name,
+        voice_config=types.VoiceConfig(
+            prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                voice_name=voice_name
+            )
+        )
+    )
+    return _NormSpeaker(name, voice_name, description or '', voice_characteristic, voice_config)
 
 
 class GeminiSpeechSynthesizer(SpeechSynthesizer):
     """Gemini-based speech synthesizer with multi-speaker support"""
     
+    __slots__ = (
+        '_model', '_voice', 'response_format', '_multi_speaker', '_speakers', 'max_retries',
+        '_client', '_speech_config', '_generate_config', '_speaker_instructions_cache',
+        '_prompt_prefix', '_cfg_key', '_audio_cache', '_audio_cache_size', '_audio_cache_lock',
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
+        
+        # Generation config is built lazily and reused until the voices change
+        self._speech_config: Optional[types.SpeechConfig] = None
+        self._generate_config: Optional[types.GenerateContentConfig] = None
+        self._speaker_instructions_cache: Optional[str] = None
+        # (instructions, prefix part) for the most recently used instructions
+        self._prompt_prefix: Optional[Tuple[str, Optional[types.Part]]] = None
+        self._cfg_key: Optional[tuple] = None
+        
         self.model = config.get('model', 'gemini-2.5-flash-preview-tts')
         self.voice = config.get('voice', 'Kore')
         self.response_format = config.get('response_format', 'wav')
         self.multi_speaker = config.get('multi_speaker', False)
         self.speakers = config.get('speakers', [])
+        self.max_retries = config.get('max_retries', 3)
+        
+        # In-memory LRU cache of (instructions, text, cfg_key) -> audio for
+        # repeated requests; a size of None means unbounded, 0 disables it
+        self._audio_cache: 'OrderedDict[tuple, bytes]' = OrderedDict()
+        self._audio_cache_size: Optional[int] = config.get('audio_cache_size', 128)
+        self._audio_cache_lock = threading.Lock()
         
         # Validate voice names
         self._validate_voices()
         
-        # Initialize Gemini client
-        api_key = os.getenv('GOOGLE_API_KEY')
-        if not api_key:
+        # Gemini client is created on first use so that voice introspection
+        # (get_voice_info, list_available_voices) needs no network setup
+        if not _api_key():
             raise ValueError("GOOGLE_API_KEY environment variable is required")
-        self.client = genai.Client(api_key=api_key)
+        self._client: Optional[genai.Client] = None
+    
+    # model / voice / multi_speaker / speakers feed the cached config, prompt
+    # prefix and audio cache key, so assigning any of them drops that derived state
+    @property
+    def model(self) -> str:
+        return self._model
+    
+    @model.setter
+    def model(self, model: str):
+        self._model = model
+        self._invalidate_caches()
+    
+    @property
+    def voice(self) -> str:
+        return self._voice
+    
+    @voice.setter
+    def voice(self, voice: str):
+        self._voice = voice
+        self._invalidate_caches()
+    
+    @property
+    def multi_speaker(self) -> bool:
+        return self._multi_speaker
+    
+    @multi_speaker.setter
+    def multi_speaker(self, multi_speaker: bool):
+        self._multi_speaker = multi_speaker
+        self._invalidate_caches()
+    
+    @property
+    def speakers(self) -> List[_NormSpeaker]:
+        return self._speakers
+    
+    @speakers.setter
+    def speakers(self, speakers: List[Any]):
+        # dict / 属性オブジェクトのどちらで渡されても _NormSpeaker に揃える
+        self._speakers = [_normalize_speaker(speaker) for speaker in speakers]
+        self._invalidate_caches()
+    
+    @property
+    def client(self) -> genai.Client:
+        """Shared Gemini client, created lazily on first access"""
+        if self._client is None:
+            self._client = _get_client(_api_key())
+        return self._client
+    
+    @client.setter
+    def client(self, client: genai.Client):
+        self._client = client
     
     def _validate_voices(self):
         """Validate that all voice names are supported"""
         # Validate single voice
-        if not validate_voice(self.voice):
-            available_voices = list(GEMINI_VOICES.keys())
-            raise ValueError(f"Unsupported voice '{self.voice}'. Available voices: {available_voices}")
+        if self.voice not in _VOICE_SET:
+            raise ValueError(f"Unsupported voice '{self.voice}'. Available voices: {_VOICE_NAMES_STR}")
         
         # Validate multi-speaker voices
         if self.multi_speaker and self.speakers:
             for speaker in self.speakers:
-                if isinstance(speaker, dict):
-                    voice_name = speaker.get('voice_name', '')
-                else:
-                    voice_name = getattr(speaker, 'voice_name', '')
-                
-                if not validate_voice(voice_name):
-                    available_voices = list(GEMINI_VOICES.keys())
-                    raise ValueError(f"Unsupported voice '{voice_name}' for speaker. Available voices: {available_voices}")
+                if speaker.voice_name not in _VOICE_SET:
+                    raise ValueError(f"Unsupported voice '{speaker.voice_name}' for speaker. Available voices: {_VOICE_NAMES_STR}")
     
     def get_voice_info(self, voice_name: str = None) -> Optional[Dict[str, str]]:
         """Get information about a voice"""
@@ -76,27 +302,56 @@ class GeminiSpeechSynthesizer(SpeechSynthesizer):
             for name, info in GEMINI_VOICES.items()
         }
     
-    def _build_prompt(self, text: str, instructions: str = "") -> str:
-        """Build the complete prompt including speaker descriptions"""
-        prompt_parts = []
+    def _build_contents(self, text: str, instructions: str = "") -> types.Content:
+        """Build the request contents including speaker descriptions
         
-        # 基本の指示を追加
-        if instructions:
-            prompt_parts.append(instructions)
+        The constant instructions/speaker prefix and the text are sent as
+        separate parts, so the unchanged prefix can be recognized by Gemini's
+        implicit prompt caching across requests.
+        """
+        prefix_part = self._get_prefix_part(instructions)
+        text_part = types.Part(text=text)
+        parts = [prefix_part, text_part] if prefix_part is not None else [text_part]
+        return types.Content(role='user', parts=parts)
+    
+    def _get_prefix_part(self, instructions: str = "") -> Optional[types.Part]:
+        """Return the constant part of the prompt placed before the text
+        
+        The part is cached for the last instructions seen, so repeated calls
+        with the same instructions reuse the same object. Returns None when
+        there is nothing to place before the text.
+        """
+        cached = self._prompt_prefix
+        if cached is not None and cached[0] == instructions:
+            return cached[1]
         
         # 複数話者モードの場合、話者の説明を追加
+        speaker_instructions = ""
         if self.multi_speaker and self.speakers:
             speaker_instructions = self._build_speaker_instructions()
-            if speaker_instructions:
-                prompt_parts.append(speaker_instructions)
         
-        # テキストを追加
-        prompt_parts.append(text)
+        # 基本の指示・話者の説明をテキストの前に置く
+        if instructions and speaker_instructions:
+            prefix = f"{instructions}\n\n{speaker_instructions}\n\n"
+        elif instructions:
+            prefix = f"{instructions}\n\n"
+        elif speaker_instructions:
+            prefix = f"{speaker_instructions}\n\n"
+        else:
+            prefix = ""
         
-        return "\n\n".join(prompt_parts)
+        prefix_part = types.Part(text=prefix) if prefix else None
+        self._prompt_prefix = (instructions, prefix_part)
+        return prefix_part
     
     def _build_speaker_instructions(self) -> str:
-        """Build speaker-specific voice style instructions"""
+        """Build speaker-specific voice style instructions (cached until speakers change)"""
+        if self._speaker_instructions_cache is None:
+            self._speaker_instructions_cache = self._compute_speaker_instructions()
+        return self._speaker_instructions_cache
+    
+    def _compute_speaker_instructions(self) -> str:
+        """Render the voice style instructions block for the current speakers"""
         if not self.speakers:
             return ""
         
@@ -104,87 +359,301 @@ class GeminiSpeechSynthesizer(SpeechSynthesizer):
         instructions.append("Voice style instructions for each speaker:")
         
         for speaker in self.speakers:
-            if isinstance(speaker, dict):
-                name = speaker.get('name', '')
-                description = speaker.get('description', '')
-                voice_name = speaker.get('voice_name', '')
-            else:
-                name = getattr(speaker, 'name', '')
-                description = getattr(speaker, 'description', '')
-                voice_name = getattr(speaker, 'voice_name', '')
-            
-            if name and description:
-                # 音声の特徴情報も取得
-                voice_info = get_voice_info(voice_name)
-                voice_characteristic = voice_info.characteristic if voice_info else ""
-                
-                speaker_instruction = f"- {name}: {description}"
-                if voice_characteristic:
-                    speaker_instruction += f" (Voice characteristic: {voice_characteristic})"
+            if speaker.name and speaker.description:
+                speaker_instruction = f"- {speaker.name}: {speaker.description}"
+                if speaker.voice_characteristic:
+                    speaker_instruction += f" (Voice characteristic: {speaker.voice_characteristic})"
                 
                 instructions.append(speaker_instruction)
         
         return "\n".join(instructions)
     
-    def synthesize(self, text: str, instructions: str = "") -> bytes:
-        """Synthesize speech using Gemini models with optional multi-speaker support"""
-        try:
-            # プロンプトを構築
-            prompt = self._build_prompt(text, instructions)
-            
-            # 音声設定を構築
-            if self.multi_speaker and self.speakers:
-                # 複数話者モード
-                speech_config = types.SpeechConfig(
-                    multi_speaker_voice_config = types.MultiSpeakerVoiceConfig(
-                        speaker_voice_configs = [
-                            types.SpeakerVoiceConfig(
-                                speaker=speaker['name'],
-                                voice_config=types.VoiceConfig(
-                                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                        voice_name=speaker['voice_name']
-                                    )
-                                )
-                            )
-                            for speaker in self.speakers
-                        ]
-                    )
+    def _invalidate_caches(self):
+        """Drop state derived from the voice/speaker settings"""
+        self._speech_config = None
+        self._generate_config = None
+        self._speaker_instructions_cache = None
+        self._prompt_prefix = None
+        self._cfg_key = None
+    
+    def _get_cfg_key(self) -> tuple:
+        """Return a hashable key identifying the current voice configuration"""
+        if self._cfg_key is None:
+            self._cfg_key = (
+                self.model,
+                self.voice,
+                self.multi_speaker,
+                tuple(
+                    (speaker.name, speaker.voice_name, speaker.description)
+                    for speaker in self.speakers
+                ),
+            )
+        return self._cfg_key
+    
+    def _build_speech_config(self) -> types.SpeechConfig:
+        """Build the speech config for the current voice settings"""
+        # 音声設定を構築
+        if self.multi_speaker and self.speakers:
+            # 複数話者モード
+            return types.SpeechConfig(
+                multi_speaker_voice_config = types.MultiSpeakerVoiceConfig(
+                    speaker_voice_configs = [speaker.voice_config for speaker in self.speakers]
                 )
-            else:
-                # 単一話者モード
-                speech_config = types.SpeechConfig(
-                    voice_config = types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=self.voice
-                        )
+            )
+        else:
+            # 単一話者モード
+            return types.SpeechConfig(
+                voice_config = types.VoiceConfig(
+                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                        voice_name=self.voice
                     )
                 )
+            )
+    
+    def _get_generate_config(self) -> types.GenerateContentConfig:
+        """Return the cached generation config, building it on first use"""
+        if self._generate_config is None:
+            self._speech_config = self._build_speech_config()
+            self._generate_config = types.GenerateContentConfig(
+                response_modalities=["AUDIO"],
+                speech_config=self._speech_config
+            )
+        return self._generate_config
+    
+    @staticmethod
+    def _extract_audio(response) -> bytes:
+        """Extract the PCM payload from a response or stream chunk"""
+        # ストリームの最後のチャンクなど、音声を含まない場合は空のバイト列を返す
+        if not response.candidates:
+            return b""
+        content = response.candidates[0].content
+        if content is None or not content.parts:
+            return b""
+        inline_data = content.parts[0].inline_data
+        if inline_data is None or not inline_data.data:
+            return b""
+        return inline_data.data
+    
+    def synthesize_stream(self, text: str, instructions: str = "",
+                          wav_header: bool = False) -> Iterator[bytes]:
+        """Synthesize speech, yielding PCM chunks as Gemini produces them
+        
+        Args:
+            text: Text to convert to speech
+            instructions: Additional instructions for speech generation
+            wav_header: Prepend a streaming WAV header to the first chunk so the
+                output can be played back before synthesis finishes
+        """
+        # プロンプトを構築
+        yield from self._stream_contents(self._build_contents(text, instructions), wav_header)
+    
+    def _stream_contents(self, contents: types.Content, wav_header: bool = False) -> Iterator[bytes]:
+        """Stream audio chunks for already built request contents
+        
+        Transient API errors are retried with backoff as long as no audio has
+        been yielded yet; a retry after that point would duplicate audio.
+        Chunks without audio are skipped, but a stream that produced no audio
+        at all raises RuntimeError.
+        """
+        attempt = 0
+        while True:
+            yielded = False
+            last_chunk = None
+            try:
+                # Gemini APIのストリーミングで音声生成
+                stream = self.client.models.generate_content_stream(
+                    model=self.model,
+                    contents=contents,
+                    config=self._get_generate_config()
+                )
+                
+                header = build_wav_header(WAV_STREAM_LENGTH, GEMINI_SAMPLE_RATE) if wav_header else b""
+                for chunk in stream:
+                    last_chunk = chunk
+                    audio_data = self._extract_audio(chunk)
+                    if not audio_data:
+                        continue
+                    if header:
+                        audio_data = header + audio_data
+                        header = b""
+                    yielded = True
+                    yield audio_data
+                
+            except Exception as e:
+                if yielded or attempt >= self.max_retries or not _is_retryable(e):
+                    raise RuntimeError(f"Error generating speech with Gemini: {e}")
+                time.sleep(_backoff_delay(attempt))
+                attempt += 1
+                continue
             
-            # Gemini APIを使用して音声生成
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_modalities=["AUDIO"],
-                    speech_config=speech_config
+            if not yielded:
+                raise _no_audio_error(last_chunk)
+            return
+    
+    def synthesize(self, text: str, instructions: str = "") -> bytes:
+        """Synthesize speech using Gemini models with optional multi-speaker support
+        
+        Results are kept in a bounded in-memory LRU cache (`audio_cache_size`,
+        default 128), so repeating a request with the same prompt and voice
+        configuration does not call the API again.
+        """
+        key = (instructions, text, self._get_cfg_key())
+        with self._audio_cache_lock:
+            audio_data = self._audio_cache.get(key)
+            if audio_data is not None:
+                self._audio_cache.move_to_end(key)
+                return audio_data
+        
+        buf = io.BytesIO()
+        for chunk in self._stream_contents(self._build_contents(text, instructions)):
+            buf.write(chunk)
+        audio_data = buf.getvalue()
+        
+        # 空の結果はキャッシュせず、次の呼び出しで再度 API に問い合わせる
+        size = self._audio_cache_size
+        if audio_data and size != 0:
+            with self._audio_cache_lock:
+                self._audio_cache[key] = audio_data
+                self._audio_cache.move_to_end(key)
+                if size is not None:
+                    while len(self._audio_cache) > size:
+                        self._audio_cache.popitem(last=False)
+        return audio_data
+    
+    def clear_audio_cache(self):
+        """Discard all cached audio"""
+        with self._audio_cache_lock:
+            self._audio_cache.clear()
+    
+    def synthesize_to(self, writer: IO[bytes], text: str, instructions: str = "",
+                      wav_header: bool = False) -> int:
+        """Write synthesized audio chunks to a file-like object as they arrive
+        
+        Unlike `synthesize`, the whole utterance never has to be held in memory.
+        
+        Returns:
+            Total number of bytes written
+        """
+        total = 0
+        for chunk in self.synthesize_stream(text, instructions, wav_header):
+            writer.write(chunk)
+            total += len(chunk)
+        return total
+    
+    async def asynthesize(self, text: str, instructions: str = "") -> bytes:
+        """Asynchronously synthesize speech using the SDK's async client
+        
+        Many requests can be awaited concurrently on one event loop, sharing the
+        client's connection pool. The SDK calls themselves run on a background
+        loop, so this can be awaited from any event loop, including successive
+        `asyncio.run` invocations.
+        """
+        contents = self._build_contents(text, instructions)
+        return await _run_on_async_loop(self._asynthesize_contents(contents))
+    
+    async def _asynthesize_contents(self, contents: types.Content) -> bytes:
+        """Request audio for built contents; runs on the background loop"""
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=contents,
+                    config=self._get_generate_config()
                 )
-            )
+                
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise RuntimeError(f"Error generating speech with Gemini: {e}")
+                await asyncio.sleep(_backoff_delay(attempt))
+                attempt += 1
+                continue
             
-            # 音声データを取得
-            audio_data = response.candidates[0].content.parts[0].inline_data.data
+            audio_data = self._extract_audio(response)
+            if not audio_data:
+                raise _no_audio_error(response)
             return audio_data
+    
+    async def asynthesize_stream(self, text: str, instructions: str = "",
+                                 wav_header: bool = False) -> AsyncIterator[bytes]:
+        """Asynchronous counterpart of synthesize_stream"""
+        contents = self._build_contents(text, instructions)
+        # チャンクごとにバックグラウンドのループで次の要素を取り出す
+        stream = self._astream_contents(contents, wav_header)
+        try:
+            while True:
+                audio_data = await _run_on_async_loop(_anext_or_none(stream))
+                if audio_data is None:
+                    return
+                yield audio_data
+        finally:
+            await _run_on_async_loop(stream.aclose())
+    
+    async def _astream_contents(self, contents: types.Content,
+                                wav_header: bool = False) -> AsyncIterator[bytes]:
+        """Stream audio chunks for built contents; runs on the background loop"""
+        attempt = 0
+        while True:
+            yielded = False
+            last_chunk = None
+            try:
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=self.model,
+                    contents=contents,
+                    config=self._get_generate_config()
+                )
+                
+                header = build_wav_header(WAV_STREAM_LENGTH, GEMINI_SAMPLE_RATE) if wav_header else b""
+                async for chunk in stream:
+                    last_chunk = chunk
+                    audio_data = self._extract_audio(chunk)
+                    if not audio_data:
+                        continue
+                    if header:
+                        audio_data = header + audio_data
+                        header = b""
+                    yielded = True
+                    yield audio_data
+                
+            except Exception as e:
+                if yielded or attempt >= self.max_retries or not _is_retryable(e):
+                    raise RuntimeError(f"Error generating speech with Gemini: {e}")
+                await asyncio.sleep(_backoff_delay(attempt))
+                attempt += 1
+                continue
             
-        except Exception as e:
-            raise RuntimeError(f"Error generating speech with Gemini: {e}")
+            if not yielded:
+                raise _no_audio_error(last_chunk)
+            return
+    
+    def synthesize_many(self, texts: List[str], instructions: str = "",
+                        max_concurrency: int = 8) -> List[bytes]:
+        """Synthesize several texts concurrently, up to `max_concurrency` at once
+        
+        Runs on the thread pool from `synthesize_batch`, so the shared sync
+        client's connection pool is reused instead of starting an event loop
+        per batch. Results are returned in the same order as `texts`.
+        """
+        return self.synthesize_batch(texts, instructions, max_workers=max_concurrency)
+    
+    def synthesize_batch(self, texts: List[str], instructions: str = "",
+                         max_workers: int = 8) -> List[bytes]:
+        """Synthesize several texts in parallel worker threads
+        
+        The API calls spend their time waiting on the network with the GIL
+        released, so the threads share the client and the cached generation
+        config. Results are returned in the same order as `texts`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda text: self.synthesize(text, instructions), texts))
     
     def add_speaker(self, speaker_name: str, voice_name: str, description: str = ""):
         """Add a speaker for multi-speaker mode"""
-        speaker = types.Speaker(
-            name=speaker_name,
-            voice_name=voice_name,
-            description=description
-        )
-        self.speakers.append(speaker)
+        self.speakers = [*self._speakers, {
+            'name': speaker_name,
+            'voice_name': voice_name,
+            'description': description,
+        }]
         self.multi_speaker = True
     
     def set_speakers(self, speakers: List[Dict[str, str]]):
@@ -193,12 +662,5 @@ class GeminiSpeechSynthesizer(SpeechSynthesizer):
         Args:
             speakers: List of speaker dictionaries with 'name', 'voice_name', and optional 'description'
         """
-        self.speakers = []
-        for speaker_info in speakers:
-            speaker = types.Speaker(
-                name=speaker_info['name'],
-                voice_name=speaker_info['voice_name'],
-                description=speaker_info.get('description', '')
-            )
-            self.speakers.append(speaker)
+        self.speakers = speakers
         self.multi_speaker = len(self.speakers) > 0
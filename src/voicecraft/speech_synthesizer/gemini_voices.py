@@ -5,12 +5,12 @@ This module defines the available voice types and their characteristics
 for Gemini TTS models.
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import re
+import sys
+from typing import Dict, List, NamedTuple
 
 
-@dataclass
-class VoiceInfo:
+class VoiceInfo(NamedTuple):
     """Information about a Gemini voice"""
     name: str
     characteristic: str
@@ -92,26 +92,54 @@ GEMINI_VOICES = {
     "Sulafat": VoiceInfo("Sulafat", "Warm", "female"),
 }
 
+# Intern the heavily repeated characteristic/category strings so equal values
+# share one object and compare by identity
+GEMINI_VOICES = {
+    name: VoiceInfo(*map(sys.intern, info)) for name, info in GEMINI_VOICES.items()
+}
+
+# Bound directly to the dict's C methods to avoid a Python frame per lookup:
+# get_voice_info(voice_name) -> Optional[VoiceInfo]
+get_voice_info = GEMINI_VOICES.get
+# validate_voice(voice_name) -> bool
+validate_voice = GEMINI_VOICES.__contains__
+
+
+# Lookup indices built once at import time
+_BY_CATEGORY: Dict[str, List[str]] = {}
+for _name, _info in GEMINI_VOICES.items():
+    _BY_CATEGORY.setdefault(_info.category.lower(), []).append(_name)
+
+_CHARACTERISTICS = [
+    (info.characteristic.lower(), name) for name, info in GEMINI_VOICES.items()
+]
 
-def get_voice_info(voice_name: str) -> Optional[VoiceInfo]:
-    """Get voice information by name"""
-    return GEMINI_VOICES.get(voice_name)
+# (keywords, suggested voices) pairs used by get_voice_suggestions
+_SUGGESTION_RULES = [
+    (("friendly", "warm", "casual"), ("Achird", "Sulafat", "Zubenelgenubi")),
+    (("professional", "formal", "business"), ("Kore", "Alnilam", "Charon")),
+    (("energetic", "exciting", "dynamic"), ("Fenrir", "Laomedeia", "Sadachbia")),
+    (("calm", "gentle", "soft"), ("Vindemiatrix", "Achernar", "Callirrhoe")),
+]
+
+# One alternation with a named group per rule so the text is scanned only once
+_SUGGESTION_PATTERN = re.compile(
+    "|".join(
+        f"(?P<rule{i}>{'|'.join(map(re.escape, keywords))})"
+        for i, (keywords, _) in enumerate(_SUGGESTION_RULES)
+    )
+)
 
 
 def get_voices_by_characteristic(characteristic: str) -> List[str]:
     """Get voice names that match a specific characteristic"""
-    return [
-        name for name, info in GEMINI_VOICES.items()
-        if characteristic.lower() in info.characteristic.lower()
-    ]
+    characteristic = characteristic.lower()
+    return [name for char, name in _CHARACTERISTICS if characteristic in char]
 
 
 def get_voices_by_category(category: str) -> List[str]:
     """Get voice names by category (female, male, neutral)"""
-    return [
-        name for name, info in GEMINI_VOICES.items()
-        if info.category.lower() == category.lower()
-    ]
+    return list(_BY_CATEGORY.get(category.lower(), ()))
 
 
 def list_all_voices() -> Dict[str, VoiceInfo]:
@@ -119,29 +147,16 @@ def list_all_voices() -> Dict[str, VoiceInfo]:
     return GEMINI_VOICES.copy()
 
 
-def validate_voice(voice_name: str) -> bool:
-    """Validate if a voice name is supported"""
-    return voice_name in GEMINI_VOICES
-
-
 def get_voice_suggestions(text_context: str = "") -> List[str]:
     """Get voice suggestions based on text context"""
     suggestions = []
     
     # Simple keyword-based suggestions
-    text_lower = text_context.lower()
-    
-    if any(word in text_lower for word in ["friendly", "warm", "casual"]):
-        suggestions.extend(["Achird", "Sulafat", "Zubenelgenubi"])
-    
-    if any(word in text_lower for word in ["professional", "formal", "business"]):
-        suggestions.extend(["Kore", "Alnilam", "Charon"])
-    
-    if any(word in text_lower for word in ["energetic", "exciting", "dynamic"]):
-        suggestions.extend(["Fenrir", "Laomedeia", "Sadachbia"])
+    matched = {m.lastgroup for m in _SUGGESTION_PATTERN.finditer(text_context.lower())}
     
-    if any(word in text_lower for word in ["calm", "gentle", "soft"]):
-        suggestions.extend(["Vindemiatrix", "Achernar", "Callirrhoe"])
+    for i, (_, voices) in enumerate(_SUGGESTION_RULES):
+        if f"rule{i}" in matched:
+            suggestions.extend(voices)
     
-    # Remove duplicates and return
-    return list(set(suggestions))
+    # Remove duplicates (keeping rule order) and return
+    return list(dict.fromkeys(suggestions))
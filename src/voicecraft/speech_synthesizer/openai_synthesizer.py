@@ -4,12 +4,24 @@ OpenAI Speech Synthesizer Module
 This module provides the OpenAI-based speech synthesizer implementation.
 """
 
-from typing import Dict, Any
-import litellm
-import base64
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import asyncio
+import binascii
+import hashlib
+import json
+import logging
+import os
+import tempfile
 from .base import SpeechSynthesizer
 
 
+logger = logging.getLogger(__name__)
+
+# Content-addressed cache of synthesized audio, keyed on model/voice/format/prompt
+AUDIO_CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'voicecraft' / 'audio'
+
+
 class OpenAISpeechSynthesizer(SpeechSynthesizer):
     """OpenAI-based speech synthesizer"""
     
@@ -18,27 +30,124 @@ class OpenAISpeechSynthesizer(SpeechSynthesizer):
         self.model = config.get('model', 'openai/gpt-4o-audio-preview')
         self.voice = config.get('voice', 'alloy')
         self.response_format = config.get('response_format', 'wav')
+        self.cache = config.get('cache', True)
+    
+    def _cache_path(self, text: str, instructions: str) -> Path:
+        """Return the cache file path for a request"""
+        # JSON 配列にすることで、区切り文字を含むフィールド同士でもキーが衝突しない
+        fields = [self.model, self.voice, self.response_format, instructions, text]
+        key = hashlib.blake2b(
+            json.dumps(fields, ensure_ascii=False).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        return AUDIO_CACHE_DIR / key[:2] / f"{key}.{self.response_format}"
+    
+    def _read_cache(self, text: str, instructions: str) -> Optional[bytes]:
+        """Return cached audio for a request, or None on a miss"""
+        if not self.cache:
+            return None
+        path = self._cache_path(text, instructions)
+        try:
+            audio_data = path.read_bytes()
+        except OSError:
+            logger.debug("audio cache miss: %s", path)
+            return None
+        logger.debug("audio cache hit: %s", path)
+        return audio_data
+    
+    def _write_cache(self, text: str, instructions: str, audio_data: bytes) -> None:
+        """Store audio in the cache atomically; failures are only logged"""
+        if not self.cache:
+            return
+        path = self._cache_path(text, instructions)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 一時ファイルに書いてからリネームし、読み手が書きかけのファイルを見ないようにする
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(audio_data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("failed to write audio cache %s: %s", path, e)
+    
+    def _completion_kwargs(self, text: str, instructions: str = "") -> Dict[str, Any]:
+        """Build the LiteLLM completion arguments for a single request"""
+        # 指示はシステムメッセージとして渡し、本文と連結しない
+        messages = [{"role": "system", "content": instructions}] if instructions else []
+        messages.append({"role": "user", "content": text})
+        
+        return {
+            'model': self.model,
+            'modalities': ["text", "audio"],
+            'audio': {"voice": self.voice, "format": self.response_format},
+            'messages': messages,
+        }
+    
+    @staticmethod
+    def _extract_audio(completion) -> bytes:
+        """Extract decoded audio bytes from a LiteLLM completion"""
+        # 音声データを取得（base64デコード）
+        # a2b_base64 は ASCII の str をそのまま受け取り、改行などの非 base64 文字を読み飛ばす
+        audio_data_b64 = completion.choices[0].message.audio.data
+        return binascii.a2b_base64(audio_data_b64)
     
     def synthesize(self, text: str, instructions: str = "") -> bytes:
         """Synthesize speech using OpenAI models"""
+        cached = self._read_cache(text, instructions)
+        if cached is not None:
+            return cached
+
+        # litellm is heavy to import, so load it only when synthesizing
+        import litellm
+
         try:
-            # プロンプトを構築
-            prompt = text
-            if instructions:
-                prompt = f"{instructions}\n\n{text}"
-            
             # LiteLLMを使用して音声生成
-            completion = litellm.completion(
-                model=self.model,
-                modalities=["text", "audio"],
-                audio={"voice": self.voice, "format": self.response_format},
-                messages=[{"role": "user", "content": prompt}],
-            )
+            completion = litellm.completion(**self._completion_kwargs(text, instructions))
+            audio_data = self._extract_audio(completion)
             
-            # 音声データを取得（base64デコード）
-            audio_data_b64 = completion.choices[0].message.audio.data
-            audio_data = base64.b64decode(audio_data_b64)
-            return audio_data
+        except Exception as e:
+            raise RuntimeError(f"Error generating speech with OpenAI: {e}")
+        
+        self._write_cache(text, instructions, audio_data)
+        return audio_data
+    
+    async def _asynthesize(self, text: str, instructions: str = "") -> bytes:
+        """Asynchronously synthesize speech using LiteLLM's async API"""
+        cached = self._read_cache(text, instructions)
+        if cached is not None:
+            return cached
+
+        import litellm
+
+        try:
+            completion = await litellm.acompletion(**self._completion_kwargs(text, instructions))
+            audio_data = self._extract_audio(completion)
             
         except Exception as e:
             raise RuntimeError(f"Error generating speech with OpenAI: {e}")
+        
+        self._write_cache(text, instructions, audio_data)
+        return audio_data
+    
+    async def _synthesize_many_async(self, texts: List[str], instructions: str,
+                                     max_concurrency: int) -> List[bytes]:
+        # レート制限に配慮して同時リクエスト数を制限する
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(text: str) -> bytes:
+            async with semaphore:
+                return await self._asynthesize(text, instructions)
+        
+        return list(await asyncio.gather(*(bounded(text) for text in texts)))
+    
+    def synthesize_many(self, texts: List[str], instructions: str = "",
+                        max_concurrency: int = 8) -> List[bytes]:
+        """Synthesize several texts concurrently with litellm.acompletion
+        
+        Results are returned in the same order as `texts`.
+        """
+        return asyncio.run(self._synthesize_many_async(texts, instructions, max_concurrency))
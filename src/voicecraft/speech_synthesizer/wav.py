@@ -0,0 +1,33 @@
+"""
+WAV Header Module
+
+This module builds the RIFF/WAVE header placed before raw 16-bit mono PCM,
+the format the speech synthesizers produce.
+"""
+
+import struct
+
+
+# Size value marking a stream whose final length is not known yet
+WAV_STREAM_LENGTH = 0xFFFFFFFF
+
+
+def build_wav_header(data_length: int, rate: int = 24000) -> bytes:
+    """Build the 44-byte WAV header for 16-bit mono PCM
+
+    Args:
+        data_length: Size of the PCM data in bytes, or WAV_STREAM_LENGTH for a
+            stream; 0xFFFFFFFF sizes are the conventional "until end of stream"
+            marker understood by players
+        rate: Sample rate in Hz
+    """
+    if data_length == WAV_STREAM_LENGTH:
+        riff_length = WAV_STREAM_LENGTH
+    else:
+        riff_length = 36 + data_length
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", riff_length, b"WAVE",
+        b"fmt ", 16, 1, 1, rate, rate * 2, 2, 16,
+        b"data", data_length,
+    )
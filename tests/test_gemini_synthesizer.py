@@ -0,0 +1,216 @@
+"""
+Tests for GeminiSpeechSynthesizer against a local fake Gemini API server.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import httpx
+from google.genai import types
+
+from voicecraft.speech_synthesizer import gemini_synthesizer
+from voicecraft.speech_synthesizer.gemini_synthesizer import GeminiSpeechSynthesizer
+
+
+PCM = b'pcm'
+# Prompts containing this marker are answered like a safety-blocked request
+BLOCKED = 'blocked'
+
+
+class _FakeGeminiHandler(BaseHTTPRequestHandler):
+    """Answers generateContent / streamGenerateContent with a fixed PCM payload"""
+
+    # Keep-alive, so pooled connections outlive a single request like a real server
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        request = json.loads(body)
+        self.server.requests.append((self.path, request))
+        if BLOCKED in json.dumps(request['contents']):
+            candidate = {'finishReason': 'SAFETY'}
+        else:
+            candidate = {
+                'content': {
+                    'role': 'model',
+                    'parts': [{'inlineData': {
+                        'mimeType': 'audio/L16',
+                        'data': base64.b64encode(PCM).decode('ascii'),
+                    }}],
+                },
+            }
+        body = json.dumps({'candidates': [candidate]})
+        if 'streamGenerateContent' in self.path:
+            payload = f"data: {body}\r\n\r\n".encode('utf-8')
+            content_type = 'text/event-stream'
+        else:
+            payload = body.encode('utf-8')
+            content_type = 'application/json'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class GeminiSpeechSynthesizerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeGeminiHandler)
+        cls.server.requests = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+        base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        real_client = gemini_synthesizer.genai.Client
+
+        def client_factory(**kwargs):
+            return real_client(http_options=types.HttpOptions(base_url=base_url), **kwargs)
+
+        patches = [
+            mock.patch.dict(os.environ, {'GOOGLE_API_KEY': 'test-key'}),
+            mock.patch.object(gemini_synthesizer.genai, 'Client', side_effect=client_factory),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        # Start from an unresolved key so the patched environment is read
+        patch = mock.patch.object(gemini_synthesizer, '_API_KEY', None)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(gemini_synthesizer.close_clients)
+
+    def test_synthesize_many_can_run_repeatedly(self):
+        synthesizer = GeminiSpeechSynthesizer({})
+
+        self.assertEqual(synthesizer.synthesize_many(['a', 'b', 'c']), [PCM] * 3)
+        self.assertEqual(synthesizer.synthesize_many(['d', 'e']), [PCM] * 2)
+        # A new instance shares the process-wide client state
+        other = GeminiSpeechSynthesizer({'voice': 'Puck'})
+        self.assertEqual(other.synthesize_many(['f']), [PCM])
+        self.assertEqual(len(self.server.requests), 6)
+
+    def test_asynthesize_works_across_event_loops(self):
+        synthesizer = GeminiSpeechSynthesizer({})
+
+        async def stream(text):
+            return b''.join([chunk async for chunk in synthesizer.asynthesize_stream(text)])
+
+        self.assertEqual(asyncio.run(synthesizer.asynthesize('a')), PCM)
+        self.assertEqual(asyncio.run(synthesizer.asynthesize('b')), PCM)
+        self.assertEqual(asyncio.run(stream('c')), PCM)
+        # The sync path keeps working alongside the async clients
+        self.assertEqual(synthesizer.synthesize('d'), PCM)
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_api_key_set_after_failed_lookup_is_picked_up(self):
+        with mock.patch.dict(os.environ, clear=True):
+            with self.assertRaisesRegex(ValueError, 'GOOGLE_API_KEY'):
+                GeminiSpeechSynthesizer({})
+        self.assertEqual(GeminiSpeechSynthesizer({}).synthesize('a'), PCM)
+
+    def test_synthesize_uses_streaming_endpoint(self):
+        synthesizer = GeminiSpeechSynthesizer({})
+
+        self.assertEqual(synthesizer.synthesize('hello'), PCM)
+        self.assertIn('streamGenerateContent', self.server.requests[0][0])
+
+    def _requested_voice(self, index):
+        speech_config = self.server.requests[index][1]['generationConfig']['speechConfig']
+        return speech_config['voiceConfig']['prebuiltVoiceConfig']['voiceName']
+
+    def test_changing_voice_invalidates_cached_config_and_audio(self):
+        synthesizer = GeminiSpeechSynthesizer({'voice': 'Kore'})
+        synthesizer.synthesize('hi', 'ins')
+        self.assertEqual(self._requested_voice(0), 'Kore')
+
+        synthesizer.voice = 'Puck'
+        synthesizer.synthesize('hi', 'ins')
+        synthesizer.synthesize('new text', 'ins')
+
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self._requested_voice(1), 'Puck')
+        self.assertEqual(self._requested_voice(2), 'Puck')
+
+    def test_response_without_audio_raises(self):
+        synthesizer = GeminiSpeechSynthesizer({})
+
+        with self.assertRaisesRegex(RuntimeError, 'SAFETY'):
+            synthesizer.synthesize(BLOCKED)
+
+        async def check_async():
+            with self.assertRaisesRegex(RuntimeError, 'SAFETY'):
+                await synthesizer.asynthesize(BLOCKED)
+            with self.assertRaisesRegex(RuntimeError, 'SAFETY'):
+                async for _ in synthesizer.asynthesize_stream(BLOCKED):
+                    pass
+
+        asyncio.run(check_async())
+
+    def test_audio_cache_is_bounded_and_freed_with_instance(self):
+        synthesizer = GeminiSpeechSynthesizer({'audio_cache_size': 1})
+        synthesizer.synthesize('a')
+        synthesizer.synthesize('a')
+        synthesizer.synthesize('b')
+        synthesizer.synthesize('a')
+        self.assertEqual(len(self.server.requests), 3)
+
+        # The cache must not hold the instance itself (only the local name and
+        # getrefcount's argument refer to it), so it is freed without the cyclic GC
+        self.assertEqual(sys.getrefcount(synthesizer), 2)
+
+    def test_assigning_speakers_normalizes_and_invalidates(self):
+        synthesizer = GeminiSpeechSynthesizer({'multi_speaker': True, 'speakers': [
+            {'name': 'A', 'voice_name': 'Kore'},
+            {'name': 'B', 'voice_name': 'Puck'},
+        ]})
+        synthesizer.synthesize('A: hi\nB: hello')
+
+        synthesizer.speakers = [
+            {'name': 'A', 'voice_name': 'Charon'},
+            {'name': 'B', 'voice_name': 'Puck'},
+        ]
+        synthesizer.synthesize('A: hi\nB: hello')
+
+        self.assertEqual(len(self.server.requests), 2)
+        speaker_configs = (self.server.requests[1][1]['generationConfig']['speechConfig']
+                           ['multiSpeakerVoiceConfig']['speakerVoiceConfigs'])
+        self.assertEqual(speaker_configs[0]['voiceConfig']['prebuiltVoiceConfig']['voiceName'], 'Charon')
+
+    def test_transport_errors_are_retried(self):
+        synthesizer = GeminiSpeechSynthesizer({})
+        response = types.GenerateContentResponse(candidates=[types.Candidate(
+            content=types.Content(parts=[types.Part(inline_data=types.Blob(data=PCM))]),
+        )])
+        client = mock.Mock()
+        client.models.generate_content_stream.side_effect = [
+            httpx.ConnectTimeout('timed out'),
+            httpx.RemoteProtocolError('connection reset'),
+            iter([response]),
+        ]
+        synthesizer.client = client
+
+        with mock.patch.object(gemini_synthesizer, '_backoff_delay', return_value=0):
+            self.assertEqual(synthesizer.synthesize('a'), PCM)
+        self.assertEqual(client.models.generate_content_stream.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
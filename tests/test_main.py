@@ -0,0 +1,80 @@
+"""
+Tests for the config helpers in the voicecraft CLI module.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from voicecraft.__main__ import quick_parse_header
+
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / 'speech_configs'
+
+
+class QuickParseHeaderTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def _write(self, text):
+        path = self.dir / 'config.yaml'
+        path.write_text(text, encoding='utf-8')
+        return path
+
+    def test_shipped_configs_match_full_parse_without_rereading(self):
+        paths = sorted(CONFIG_DIR.glob('*.yaml'))
+        self.assertTrue(paths)
+        for path in paths:
+            with self.subTest(path=path.name):
+                expected = yaml.safe_load(path.read_text(encoding='utf-8'))['model_config']
+                with mock.patch.object(Path, 'read_text', side_effect=AssertionError('full read')):
+                    header = quick_parse_header(path)
+                self.assertEqual(header, {'model_config': expected})
+
+    def test_block_scalar_lines_are_not_taken_as_keys(self):
+        path = self._write(
+            "text: |\n"
+            "  model_config: not this one\n"
+            "\n"
+            "# comment\n"
+            "model_config:\n"
+            "  name: gemini/gemini-2.5-flash-preview-tts\n"
+            "  config:\n"
+            "    voice: Kore\n"
+            "output: out.wav\n"
+        )
+        self.assertEqual(quick_parse_header(path), {'model_config': {
+            'name': 'gemini/gemini-2.5-flash-preview-tts',
+            'config': {'voice': 'Kore'},
+        }})
+
+    def test_missing_key_returns_empty_mapping(self):
+        path = self._write("text: hello\ninstructions: calm\n")
+        self.assertEqual(quick_parse_header(path), {})
+
+    def test_flow_style_falls_back_to_full_parse(self):
+        path = self._write("{text: hello, model_config: {name: m}}\n")
+        self.assertEqual(quick_parse_header(path), {'model_config': {'name': 'm'}})
+
+    def test_alias_falls_back_to_full_parse(self):
+        path = self._write(
+            "defaults: &defaults\n"
+            "  name: m\n"
+            "model_config: *defaults\n"
+        )
+        self.assertEqual(quick_parse_header(path), {'model_config': {'name': 'm'}})
+
+    def test_non_mapping_raises(self):
+        path = self._write("- a\n- b\n")
+        with self.assertRaises(ValueError):
+            quick_parse_header(path)
+
+
+if __name__ == '__main__':
+    unittest.main()